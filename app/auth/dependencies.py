@@ -8,12 +8,11 @@ and to ensure the user is active for protected endpoints.
 """
 
 
-from datetime import datetime
 from uuid import UUID
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from app.schemas.user import UserResponse
-from app.models.user import User
+from app.models.user import User, utcnow
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="auth/token")
 
@@ -53,6 +52,7 @@ def get_current_user(
                 return UserResponse(**token_data)
             # otherwise, assume it is a minimal payload with only the 'sub' key.
             elif "sub" in token_data:
+                now = utcnow()
                 return UserResponse(
                     id=token_data["sub"],
                     username="unknown",
@@ -61,14 +61,15 @@ def get_current_user(
                     last_name="User",
                     is_active=True,
                     is_verified=False,
-                    created_at=datetime.utcnow(),
-                    updated_at=datetime.utcnow(),
+                    created_at=now,
+                    updated_at=now,
                 ) #pragma: no cover
             else:
                 raise credentials_exception 
 
         # If the token data is directly a UUID (minimal payload):
         elif isinstance(token_data, UUID):
+            now = utcnow()
             return UserResponse(
                 id=token_data,
                 username="unknown",
@@ -77,8 +78,8 @@ def get_current_user(
                 last_name="User",
                 is_active=True,
                 is_verified=False,
-                created_at=datetime.utcnow(),
-                updated_at=datetime.utcnow(),
+                created_at=now,
+                updated_at=now,
             )
         else:
             raise credentials_exception #pragma: no cover
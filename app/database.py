@@ -20,9 +20,12 @@ def get_db():
         db.close()
 
 # --- New Functions Added ---
-def get_engine(database_url: str = SQLALCHEMY_DATABASE_URL):
-    """Factory function to create a new SQLAlchemy engine."""
-    return create_engine(database_url)
+def get_engine(database_url: str = SQLALCHEMY_DATABASE_URL, **engine_kwargs):
+    """Factory function to create a new SQLAlchemy engine.
+
+    Extra keyword arguments (pool settings, etc.) are passed to create_engine.
+    """
+    return create_engine(database_url, **engine_kwargs)
 
 def get_sessionmaker(engine):
     """factory function to create a new sessionmaker bound to the given engine."""
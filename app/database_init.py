@@ -1,12 +1,79 @@
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+
 from app.database import engine
 from app.models.user import Base
+from app.models.calculation import (
+    TOUCH_UPDATED_AT_FUNCTION_SQL,
+    TOUCH_UPDATED_AT_TRIGGER_SQL,
+)
+
+def upgrade_calculations_table(conn: Connection) -> None:
+    """
+    Bring a calculations table created by an older release up to date.
+
+    create_all() never alters an existing table, so databases that outlive a
+    schema change (e.g. the docker-compose postgres_data volume) keep the old
+    column definitions. Each ALTER or CREATE runs only when the live catalog
+    shows it is needed, so on an up-to-date table this issues nothing but
+    catalog reads and takes no table locks.
+    """
+    if conn.dialect.name != "postgresql":
+        return
+
+    columns = {
+        name: (data_type, default)
+        for name, data_type, default in conn.execute(text("""
+            SELECT column_name, data_type, column_default FROM information_schema.columns
+            WHERE table_schema = current_schema() AND table_name = 'calculations'
+        """))
+    }
+    if not columns:
+        return
+
+    # inputs moved from JSON to a native double precision array.
+    # A flat JSON number array maps onto an array literal once its brackets become braces.
+    if columns["inputs"][0] == "json":
+        conn.execute(text("""
+            ALTER TABLE calculations ALTER COLUMN inputs TYPE double precision[]
+            USING translate(inputs::text, '[]', '{}')::double precision[]
+        """))
+
+    # Timestamps became timezone-aware and are filled in by the database.
+    for column in ("created_at", "updated_at"):
+        data_type, default = columns[column]
+        if data_type == "timestamp without time zone":
+            conn.execute(text(
+                f"ALTER TABLE calculations ALTER COLUMN {column} TYPE timestamptz "
+                f"USING {column} AT TIME ZONE 'UTC'"
+            ))
+        if default != "now()":
+            conn.execute(text(f"ALTER TABLE calculations ALTER COLUMN {column} SET DEFAULT now()"))
+
+    function_exists = conn.execute(text(
+        "SELECT to_regprocedure('calculations_touch_updated_at()') IS NOT NULL"
+    )).scalar()
+    if not function_exists:
+        conn.execute(text(TOUCH_UPDATED_AT_FUNCTION_SQL))
+    trigger_exists = conn.execute(text("""
+        SELECT 1 FROM pg_trigger
+        WHERE tgname = 'calculations_touch_updated_at'
+          AND tgrelid = 'calculations'::regclass
+    """)).scalar()
+    if not trigger_exists:
+        conn.execute(text(TOUCH_UPDATED_AT_TRIGGER_SQL))
 
 def init_db():
-    Base.metadata.create_all(bind=engine)
+    with engine.begin() as conn:
+        if conn.dialect.name == "postgresql":
+            # Workers booting together take turns, so the catalog checks above
+            # never race each other into duplicate CREATEs.
+            conn.execute(text("SELECT pg_advisory_xact_lock(hashtext('app.database_init'))"))
+        Base.metadata.create_all(bind=conn)
+        upgrade_calculations_table(conn)
 
 def drop_db():
     Base.metadata.drop_all(bind=engine)
 
 if __name__ == "__main__":
     init_db() # pragma: no cover
-
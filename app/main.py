@@ -17,6 +17,7 @@ from fastapi.responses import HTMLResponse, RedirectResponse, JSONResponse
 from fastapi.staticfiles import StaticFiles  # For serving static files (CSS, JS)
 from fastapi.templating import Jinja2Templates  # For HTML templates
 
+from sqlalchemy import func
 from sqlalchemy.orm import Session  # SQLAlchemy database session
 
 import uvicorn  # ASGI server for running FastAPI apps
@@ -28,7 +29,8 @@ from app.models.user import User  # Database model for users
 from app.schemas.calculation import CalculationBase, CalculationResponse, CalculationUpdate  # API request/response schemas
 from app.schemas.token import TokenResponse  # API token schema
 from app.schemas.user import UserCreate, UserResponse, UserLogin  # User schemas
-from app.database import Base, get_db, engine  # Database connection
+from app.database import get_db  # Database connection
+from app.database_init import init_db  # Table creation and in-place upgrades
 
 
 # Create table on startup using lifespan event
@@ -38,10 +40,10 @@ async def lifespan(app: FastAPI):
     """
     Application lifespan event for startup and shutdown.
 
-    Creates database tables on startup.
+    Creates database tables on startup and upgrades older ones in place.
     """
     print("Creating tables...")
-    Base.metadata.create_all(bind=engine)
+    init_db()
     print("Tables created successfully!")
     yield  # This is where application runs
     # Cleanup code would go here (after yield), but we don't need any
@@ -227,7 +229,7 @@ def create_calculation(
         db.add(new_calculation)
         db.commit()
         db.refresh(new_calculation)
-        return new_calculation
+        return CalculationResponse.from_orm_trusted(new_calculation)
 
     except ValueError as e:
         db.rollback()
@@ -247,7 +249,7 @@ def list_calculations(
     List all calculations for the current user.
     """
     calculations = db.query(Calculation).filter(Calculation.user_id == current_user.id).all()
-    return calculations
+    return [CalculationResponse.from_orm_trusted(calc) for calc in calculations]
 
 
 # Read / Retrieve a Specific Calculation by ID
@@ -272,7 +274,7 @@ def get_calculation(
     if not calculation:
         raise HTTPException(status_code=404, detail="Calculation not found.")
 
-    return calculation
+    return CalculationResponse.from_orm_trusted(calculation)
 
 
 # Edit / Update a Calculation
@@ -302,10 +304,10 @@ def update_calculation(
         calculation.inputs = calculation_update.inputs
         calculation.result = calculation.get_result()
 
-    calculation.updated_at = datetime.utcnow()
+    calculation.updated_at = func.now()
     db.commit()
     db.refresh(calculation)
-    return calculation
+    return CalculationResponse.from_orm_trusted(calculation)
 
 
 # Delete a Calculation
@@ -6,15 +6,26 @@ SQLAlchemy models for calculation operations.
 This module defines abstract and concrete classes for addition, subtraction, multiplication, and division.
 It implements polymorphic behavior and result computation for each calculation type.
 """
-from datetime import datetime
+import operator
+import reprlib
 import uuid
-from typing import List
-from sqlalchemy import Column, String, DateTime, ForeignKey, JSON, Float
-from sqlalchemy.dialects.postgresql import UUID
+from functools import reduce
+from typing import List, Tuple
+import numpy as np
+from sqlalchemy import Column, String, DateTime, ForeignKey, Float, JSON, DDL, FetchedValue, event, insert
+from sqlalchemy.dialects.postgresql import UUID, ARRAY
 from sqlalchemy.orm import relationship, declared_attr
-from sqlalchemy.ext.declarative import declared_attr
+from sqlalchemy.sql import func
 from app.database import Base
 
+# Input lists at least this long are reduced with NumPy; for shorter lists the
+# cost of building the array outweighs the faster reduction loop.
+VECTORIZE_THRESHOLD = 32
+
+# Bounded repr for inputs so logging a calculation never formats a huge list.
+_inputs_repr = reprlib.Repr()
+_inputs_repr.maxlist = 8
+
 class AbstractCalculation:
     """
     Abstract base class for calculation models.
@@ -22,6 +33,31 @@ class AbstractCalculation:
     Provides common table columns and relationships for all calculation types.
     Implements factory method and interface for result computation.
     """
+
+    # Concrete calculation classes keyed by polymorphic identity, filled in by
+    # __init_subclass__ as each subclass is defined.
+    _REGISTRY = {}
+
+    # Binary operator folded over the inputs by get_result(), and the NumPy ufunc
+    # used for long input lists. Concrete subclasses set both.
+    _reduce = None
+    _ufunc = None
+
+    # (tuple of inputs, result) from the last get_result() call on this instance.
+    _result_cache = None
+
+    def __init_subclass__(cls, **kwargs):
+        """
+        Registers each concrete calculation subclass under its polymorphic identity.
+
+        The polymorphic base (the class that declares polymorphic_on) is not
+        registered, so create() only returns concrete calculation types.
+        """
+        super().__init_subclass__(**kwargs)
+        mapper_args = cls.__dict__.get("__mapper_args__", {})
+        identity = mapper_args.get("polymorphic_identity")
+        if identity and "polymorphic_on" not in mapper_args:
+            AbstractCalculation._REGISTRY[identity] = cls
     
     @declared_attr
     def __tablename__(cls):
@@ -69,9 +105,13 @@ class AbstractCalculation:
     def inputs(cls):
         """
         Returns the inputs column for the calculation model.
+
+        Stored as a native double precision array so values travel in
+        PostgreSQL's array format instead of being serialized as JSON text.
         """
         return Column(
-            JSON, 
+            # SQLite (used by the fast test mode) has no arrays; store JSON there.
+            ARRAY(Float).with_variant(JSON, "sqlite"), 
             nullable=False
         )
 
@@ -89,10 +129,12 @@ class AbstractCalculation:
     def created_at(cls):
         """
         Returns the created_at column for the calculation model.
+
+        Filled in by the database from the transaction clock.
         """
         return Column(
-            DateTime, 
-            default=datetime.utcnow,
+            DateTime(timezone=True), 
+            server_default=func.now(),
             nullable=False
         )
 
@@ -100,11 +142,14 @@ class AbstractCalculation:
     def updated_at(cls):
         """
         Returns the updated_at column for the calculation model.
+
+        Filled in by the database on insert and refreshed on every update by the
+        calculations_touch_updated_at trigger.
         """
         return Column(
-            DateTime, 
-            default=datetime.utcnow,
-            onupdate=datetime.utcnow,
+            DateTime(timezone=True), 
+            server_default=func.now(),
+            server_onupdate=FetchedValue(),
             nullable=False
         )
 
@@ -135,31 +180,101 @@ class AbstractCalculation:
         Raises:
             ValueError: If the calculation_type is not supported
         """
-        calculation_classes = {
-            'addition': Addition,
-            'subtraction': Subtraction,
-            'multiplication': Multiplication,
-            'division': Division,
-        }
-        calculation_class = calculation_classes.get(calculation_type.lower())
+        calculation_class = AbstractCalculation._REGISTRY.get(calculation_type.lower())
         if not calculation_class:
             raise ValueError(f"Unsupported calculation type: {calculation_type}")
         return calculation_class(user_id=user_id, inputs=inputs)
 
+    @classmethod
+    def create_many(cls, db, rows: List[Tuple[str, uuid.UUID, List[float]]]) -> List[uuid.UUID]:
+        """
+        Persist several calculations with one multi-row INSERT.
+
+        Each row is built through create() and its result computed, then all rows
+        are sent in a single executemany statement with RETURNING, instead of one
+        unit-of-work INSERT per calculation.
+
+        Args:
+            db: SQLAlchemy database session
+            rows: (calculation_type, user_id, inputs) tuples
+
+        Returns:
+            List of the new calculation ids, in the same order as rows
+
+        Raises:
+            ValueError: If a calculation_type is not supported or its inputs are invalid
+        """
+        values = []
+        for calculation_type, user_id, inputs in rows:
+            calculation = cls.create(calculation_type, user_id, inputs)
+            values.append({
+                "type": calculation.type,
+                "user_id": user_id,
+                "inputs": inputs,
+                "result": calculation.get_result(),
+            })
+        if not values:
+            return []
+        table = Calculation.__table__
+        stmt = insert(table).returning(table.c.id, sort_by_parameter_order=True)
+        return db.execute(stmt, values).scalars().all()
+
     def get_result(self) -> float:
         """
         Method to compute calculation result.
         
-        This is an abstract method that must be implemented by subclasses.
-        It defines the interface that all calculation types must implement.
+        The result is memoized on the instance together with a snapshot of the
+        inputs it was computed from. Later calls return it directly as long as the
+        inputs still hold the same values; reassigning or editing them in place
+        computes it again.
         
         Returns:
             float: The result of the calculation
             
         Raises:
-            NotImplementedError: If not implemented by a subclass
+            NotImplementedError: If the subclass does not define an operation
+            ValueError: If the inputs are not valid for the calculation
+        """
+        # Compare against a snapshot of the values so in-place edits to the list are noticed.
+        cached = self._result_cache
+        if cached is not None and isinstance(self.inputs, list) and cached[0] == tuple(self.inputs):
+            return cached[1]
+        result = self._compute_result()
+        self._result_cache = (tuple(self.inputs), result)
+        return result
+
+    def _compute_result(self) -> float:
+        """
+        Folds the inputs left to right with the operation the subclass sets in
+        _reduce. Short input lists go through functools.reduce, which loops in C;
+        lists of VECTORIZE_THRESHOLD or more values use the matching NumPy ufunc
+        in _ufunc over a float64 array.
+        
+        Raises:
+            NotImplementedError: If the subclass does not define an operation
+            ValueError: If inputs are not a list or if fewer than 2 numbers provided
+        """
+        if self._reduce is None:
+            raise NotImplementedError
+        if not isinstance(self.inputs, list):
+            raise ValueError("Inputs must be a list of numbers.")
+        if len(self.inputs) < 2:
+            raise ValueError("Inputs must be a list with at least two numbers.")
+        if len(self.inputs) >= VECTORIZE_THRESHOLD:
+            return self._reduce_array(np.asarray(self.inputs, dtype=np.float64))
+        return self._reduce_list(self.inputs)
+
+    def _reduce_list(self, inputs: List[float]) -> float:
+        """
+        Folds a short input list with functools.reduce.
         """
-        raise NotImplementedError
+        return reduce(self._reduce, inputs)
+
+    def _reduce_array(self, values: np.ndarray) -> float:
+        """
+        Folds a float64 array of inputs with the subclass's NumPy ufunc.
+        """
+        return float(self._ufunc.reduce(values))
 
     def __repr__(self):
         """
@@ -167,8 +282,9 @@ class AbstractCalculation:
         
         Returns:
             str: A string showing the calculation type and inputs
+                 (truncated after 8 values)
         """
-        return f"<Calculation(type={self.type}, inputs={self.inputs})>"
+        return f"<Calculation(type={self.type}, inputs={_inputs_repr.repr(self.inputs)})>"
 
 class Calculation(Base, AbstractCalculation):
     """
@@ -182,6 +298,30 @@ class Calculation(Base, AbstractCalculation):
         #"with_polymorphic": "*"  # Eager load all subclass columns (commented out)
     }
 
+# PostgreSQL has no ON UPDATE column clause, so a trigger keeps updated_at current.
+# The statements are shared with app.database_init, which installs them on tables
+# that predate the trigger.
+TOUCH_UPDATED_AT_FUNCTION_SQL = """
+    CREATE OR REPLACE FUNCTION calculations_touch_updated_at() RETURNS trigger AS $$
+    BEGIN
+        NEW.updated_at := now();
+        RETURN NEW;
+    END;
+    $$ LANGUAGE plpgsql;
+"""
+
+TOUCH_UPDATED_AT_TRIGGER_SQL = """
+    CREATE OR REPLACE TRIGGER calculations_touch_updated_at
+    BEFORE UPDATE ON calculations
+    FOR EACH ROW EXECUTE FUNCTION calculations_touch_updated_at();
+"""
+
+event.listen(
+    Calculation.__table__,
+    "after_create",
+    DDL(TOUCH_UPDATED_AT_FUNCTION_SQL + TOUCH_UPDATED_AT_TRIGGER_SQL).execute_if(dialect="postgresql")
+)
+
 class Addition(Calculation):
     """
     Addition calculation subclass.
@@ -193,23 +333,8 @@ class Addition(Calculation):
     """
     __mapper_args__ = {"polymorphic_identity": "addition"}
 
-    def get_result(self) -> float:
-        """
-        Calculate the sum of all input values.
-        
-        Validates inputs and returns the sum using Python's built-in sum() function.
-        
-        Returns:
-            float: The sum of all input values
-            
-        Raises:
-            ValueError: If inputs are not a list or if fewer than 2 numbers provided
-        """
-        if not isinstance(self.inputs, list):
-            raise ValueError("Inputs must be a list of numbers.")
-        if len(self.inputs) < 2:
-            raise ValueError("Inputs must be a list with at least two numbers.") #pragma: no cover
-        return sum(self.inputs)
+    _reduce = staticmethod(operator.add)
+    _ufunc = np.add
 
 class Subtraction(Calculation):
     """
@@ -222,26 +347,8 @@ class Subtraction(Calculation):
     """
     __mapper_args__ = {"polymorphic_identity": "subtraction"}
 
-    def get_result(self) -> float:
-        """
-        Calculate the result of subtracting subsequent values from the first value.
-        
-        Takes the first number and subtracts all remaining numbers sequentially.
-        
-        Returns:
-            float: The result of the subtraction sequence
-            
-        Raises:
-            ValueError: If inputs are not a list or if fewer than 2 numbers provided
-        """
-        if not isinstance(self.inputs, list):
-            raise ValueError("Inputs must be a list of numbers.") #pragma: no cover
-        if len(self.inputs) < 2:
-            raise ValueError("Inputs must be a list with at least two numbers.")
-        result = self.inputs[0]
-        for value in self.inputs[1:]:
-            result -= value
-        return result
+    _reduce = staticmethod(operator.sub)
+    _ufunc = np.subtract
 
 class Multiplication(Calculation):
     """
@@ -254,24 +361,8 @@ class Multiplication(Calculation):
     """
     __mapper_args__ = {"polymorphic_identity": "multiplication"}
 
-    def get_result(self) -> float:
-        """
-        Calculate the product of all input values.
-        
-        Returns:
-            float: The product of all input values
-            
-        Raises:
-            ValueError: If inputs are not a list or if fewer than 2 numbers provided
-        """
-        if not isinstance(self.inputs, list):
-            raise ValueError("Inputs must be a list of numbers.") #pragma: no cover
-        if len(self.inputs) < 2:
-            raise ValueError("Inputs must be a list with at least two numbers.") #pragma: no cover
-        result = 1
-        for value in self.inputs:
-            result *= value
-        return result
+    _reduce = staticmethod(operator.mul)
+    _ufunc = np.multiply
 
 class Division(Calculation):
     """
@@ -287,28 +378,31 @@ class Division(Calculation):
     """
     __mapper_args__ = {"polymorphic_identity": "division"}
 
-    def get_result(self) -> float:
+    _reduce = staticmethod(operator.truediv)
+    _ufunc = np.divide
+
+    def _reduce_list(self, inputs: List[float]) -> float:
         """
         Calculate the result of dividing the first value by all subsequent values.
         
-        Takes the first number and divides by all remaining numbers sequentially.
-        Includes validation to prevent division by zero.
+        Checks every divisor before folding, so the reduction itself needs no
+        per-value zero test.
         
-        Returns:
-            float: The result of the division sequence
-            
         Raises:
-            ValueError: If inputs are not a list, if fewer than 2 numbers provided,
-                        or if attempting to divide by zero
+            ValueError: If attempting to divide by zero
         """
-        if not isinstance(self.inputs, list):
-            raise ValueError("Inputs must be a list of numbers.") #pragma: no cover
-        if len(self.inputs) < 2:
-            raise ValueError("Inputs must be a list with at least two numbers.")
-        result = self.inputs[0]
-        for value in self.inputs[1:]:
-            if value == 0:
-                raise ValueError("Cannot divide by zero.")
-            result /= value
-        return result
-    
+        if 0 in inputs[1:]:
+            raise ValueError("Cannot divide by zero.")
+        return super()._reduce_list(inputs)
+
+    def _reduce_array(self, values: np.ndarray) -> float:
+        """
+        Array counterpart of _reduce_list: the divisors are checked with one
+        vectorized comparison on the same array that is then reduced.
+        
+        Raises:
+            ValueError: If attempting to divide by zero
+        """
+        if np.any(values[1:] == 0.0):
+            raise ValueError("Cannot divide by zero.")
+        return super()._reduce_array(values)
@@ -9,6 +9,8 @@ Includes helper functions and configuration imports.
 
 """
 
+import base64
+import binascii
 import uuid
 from datetime import datetime, timezone, timedelta
 from sqlalchemy import Column, String, Boolean, DateTime, or_
@@ -270,6 +272,16 @@ class User(Base):
         Returns:
             UUID or None: The user UUID if token is valid, None otherwise.
         """
+        # Cheap structural checks first: a JWT is three dot-separated segments
+        # with a base64url header, so anything else never reaches jwt.decode.
+        if not isinstance(token, str) or token.count(".") != 2:
+            return None
+        header = token.split(".", 1)[0]
+        try:
+            base64.urlsafe_b64decode(header + "=" * (-len(header) % 4))
+        except (binascii.Error, ValueError):
+            return None
+
         from app.core.config import settings
         from jose import jwt, JWTError
         try:
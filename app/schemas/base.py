@@ -7,6 +7,18 @@ This module defines the base schemas for user-related data.
 
 from pydantic import BaseModel, EmailStr, Field, ConfigDict, model_validator
 
+def check_password_characters(password: str) -> None:
+    """
+    Require an uppercase letter, a lowercase letter and a digit, as judged by
+    str.isupper/islower/isdigit. Raises ValueError naming the first rule missed.
+    """
+    if not any(map(str.isupper, password)):
+        raise ValueError("Password must contain at least one uppercase letter")
+    if not any(map(str.islower, password)):
+        raise ValueError("Password must contain at least one lowercase letter")
+    if not any(map(str.isdigit, password)):
+        raise ValueError("Password must contain at least one digit")
+
 class UserBase(BaseModel):
     """
     Base user schema with common fields.
@@ -16,7 +28,7 @@ class UserBase(BaseModel):
     email: EmailStr = Field(example="john.doe@example.com")
     username: str = Field(min_length=3, max_length=50, example="johndoe")
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, extra="forbid")
 
 class PasswordMixin(BaseModel):
     password: str = Field(
@@ -28,16 +40,11 @@ class PasswordMixin(BaseModel):
 
     @model_validator(mode="after")
     def validate_password(self) -> "PasswordMixin":
-        if not any(char.isupper() for char in self.password):
-            raise ValueError("Password must contain at least one uppercase letter")
-        if not any(char.islower() for char in self.password):
-            raise ValueError("Password must contain at least one lowercase letter")
-        if not any(char.isdigit() for char in self.password):
-            raise ValueError("Password must contain at least one digit")
+        check_password_characters(self.password)
         # Removed special character check so that "SecurePass123" is valid.
         return self
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, extra="forbid")
 
 
 class UserCreate(UserBase, PasswordMixin):
@@ -55,11 +62,4 @@ class UserLogin(BaseModel):
     username: str = Field(min_length=3, max_length=50, example="johndoe")
     password: str = Field(min_length=8, example="supersecretpassword")
 
-
-
-
-
-
-
-
-
+    model_config = ConfigDict(extra="forbid")
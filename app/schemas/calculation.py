@@ -8,8 +8,9 @@ Used for data validation and serialization in API endpoints.
 
 from dataclasses import field
 from enum import Enum
-from pydantic import BaseModel, Field, ConfigDict, model_validator, field_validator
-from typing import List, Optional
+from functools import lru_cache
+from pydantic import BaseModel, BeforeValidator, Field, ConfigDict, model_validator
+from typing import Annotated, List, Optional
 from uuid import UUID
 from datetime import datetime
 
@@ -23,6 +24,50 @@ class CalculationType(str, Enum):
     DIVISION = "division"
 
 
+# Built once at import time instead of on every validation.
+_ALLOWED_TYPES = frozenset(e.value for e in CalculationType)
+_TYPE_ERROR = f"Type must be one of: {', '.join(sorted(_ALLOWED_TYPES))}"
+
+@lru_cache(maxsize=16)
+def _normalize_type(value: str) -> str:
+    """
+    Lowercase a calculation type string and check that it is allowed.
+
+    Results are cached, so repeated requests with the same spelling skip the work.
+
+    Raises:
+        ValueError: If the value is not a valid calculation type
+    """
+    normalized = value.lower()
+    if normalized not in _ALLOWED_TYPES:
+        raise ValueError(_TYPE_ERROR)
+    return normalized
+
+def _validate_type(v):
+    """
+    Validates the calculation type before conversion to an enum.
+
+    It ensure that:
+    1. The input is a string
+    2. The value is one of the allowed calculation types
+    3. The value is consistently converted to lowercase
+
+    Args:
+        v: The input value to validate
+
+    Returns:
+        str: The validated and normalized string value
+
+    Raises:
+        ValueError: If the input is not a valid calculation type
+    """
+    if not isinstance(v, str):
+        raise ValueError(_TYPE_ERROR)
+    return _normalize_type(v)
+
+# Calculation type normalized by a single plain function before enum conversion.
+CalculationTypeField = Annotated[CalculationType, BeforeValidator(_validate_type)]
+
 class CalculationBase(BaseModel):
     """
     Base schema for a calculation, including type and input values.
@@ -30,7 +75,7 @@ class CalculationBase(BaseModel):
     This class provides validation for calculation type and input values,
     ensuring correct data is provided for mathematical operations.
     """
-    type: CalculationType = Field(
+    type: CalculationTypeField = Field(
         ...,  # The ... means this field is required
         description="Type of calculation (addition, subtraction, multiplication, division)",
         example="addition"
@@ -39,56 +84,10 @@ class CalculationBase(BaseModel):
         ...,  # The ... means this field is required
         description="List of numeric inputs for the calculation",
         example=[10.5, 3, 2],
-        min_items=2  # Ensures at least 2 numbers are provided
+        min_items=2,  # Ensures at least 2 numbers are provided
+        strict=True  # pydantic-core rejects non-list input without a Python callback
     )
 
-    @field_validator("type", mode='before')
-    @classmethod
-    def validate_type(cls, v):
-        """
-        Validates the calculation type before conversion to an enum.
-
-        It ensure that:
-        1. The input is a string
-        2. The value is one of the allowed calculation types
-        3. The value is consistently converted to lowercase
-
-        Args:
-            v: The input value to validate
-
-        Returns:
-            str: The validated and normalized string value
-
-        Raises:
-            ValueError: If the input is not a valid calculation type
-        """
-        allowed = {e.value for e in CalculationType}
-        # Ensure v is a string and check (in lowercase) if it's allowed.
-        if not isinstance(v, str) or v.lower() not in allowed:
-            raise ValueError(f"Type must be one of: {', '.join(sorted(allowed))}")
-        return v.lower()
-    
-    @field_validator("inputs", mode="before")
-    @classmethod
-    def check_inputs_is_list(cls, v):
-        """
-        Validates that the input field is a list.
-
-        This validator ensures that the input is a list type.
-
-        Args:
-            v: The input value to validate
-
-        Returns:
-            list: The validated list
-
-        Raises:
-            ValueError: If the input is not a valid list
-        """
-        if not isinstance(v, list):
-            raise ValueError("Input should be a valid list")
-        return v
-    
     @model_validator(mode='after')
     def validate_inputs(self) -> "CalculationBase":
         """
@@ -113,11 +112,14 @@ class CalculationBase(BaseModel):
             raise ValueError("At least two numbers are required for calculation") #pragma: no cover
         if self.type == CalculationType.DIVISION:
             # Prevent division by zero (skip the first value as numerator)
-            if any(x == 0 for x in self.inputs[1:]):
+            if 0 in self.inputs[1:]:
                 raise ValueError("Cannot divide by zero") #pragma: no cover
         return self
     
     model_config = ConfigDict(
+        # Clients may send fields the server fills in itself (such as user_id); drop them
+        extra="ignore",
+
         # Allow conversion from SQLAlchemy models to Pydantic models
         from_attributes=True,
         
@@ -144,6 +146,7 @@ class CalculationCreate(CalculationBase):
     )
 
     model_config = ConfigDict(
+        extra="forbid",
         # Example for documentation and testing
         json_schema_extra={
             "example": {
@@ -164,7 +167,8 @@ class CalculationUpdate(BaseModel):
         None,  # None means this field is optional
         description="Updated list of numeric inputs for the calculation",
         example=[42, 7],
-        min_items=2  # If provided, at least 2 items are required
+        min_items=2,  # If provided, at least 2 items are required
+        strict=True
     )
 
     @model_validator(mode='after')
@@ -183,6 +187,7 @@ class CalculationUpdate(BaseModel):
         return self
 
     model_config = ConfigDict(
+        extra="forbid",
         from_attributes=True,
         json_schema_extra={"example": {"inputs": [42, 7]}}
     )
@@ -218,6 +223,20 @@ class CalculationResponse(CalculationBase):
         example=15.5
     )
 
+    @classmethod
+    def from_orm_trusted(cls, obj) -> "CalculationResponse":
+        """
+        Build a response from a Calculation row without running validation.
+
+        Rows loaded from our own database were validated on the way in, so the
+        validator chain is skipped via model_construct. Only use this for ORM
+        objects, never for client-supplied data.
+        """
+        data = {name: getattr(obj, name) for name in cls.model_fields}
+        # The column stores the plain string; keep the enum type for serialization.
+        data["type"] = CalculationType(data["type"])
+        return cls.model_construct(**data)
+
     model_config = ConfigDict(
         # Allow conversion from SQLAlchemy models to this Pydantic model
         from_attributes=True,
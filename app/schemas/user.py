@@ -1,8 +1,14 @@
+import re
 from typing import Optional
 from uuid import UUID
 from datetime import datetime
 from pydantic import BaseModel, EmailStr, Field, ConfigDict, model_validator
 
+from app.schemas.base import check_password_characters
+
+# UserCreate also requires one of these; the other character rules live in base.
+_SPECIAL = re.compile("[" + re.escape("!@#$%^&*()_+-=[]{}|;:,.<>?") + "]")
+
 class UserBase(BaseModel):
     """Base user schema with common fields"""
     first_name: str = Field(
@@ -28,7 +34,7 @@ class UserBase(BaseModel):
         description="User's unique username"
     )
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, extra="forbid")
 
 class UserCreate(UserBase):
     """Schema for user creation with password validation"""
@@ -58,17 +64,13 @@ class UserCreate(UserBase):
         password = self.password
         if len(password) < 8:
             raise ValueError("Password must be at least 8 characters long")
-        if not any(char.isupper() for char in password):
-            raise ValueError("Password must contain at least one uppercase letter")
-        if not any(char.islower() for char in password):
-            raise ValueError("Password must contain at least one lowercase letter")
-        if not any(char.isdigit() for char in password):
-            raise ValueError("Password must contain at least one digit")
-        if not any(char in "!@#$%^&*()_+-=[]{}|;:,.<>?" for char in password):
+        check_password_characters(password)
+        if not _SPECIAL.search(password):
             raise ValueError("Password must contain at least one special character")
         return self
 
     model_config = ConfigDict(
+        extra="forbid",
         json_schema_extra={
             "example": {
                 "first_name": "John",
@@ -113,6 +115,7 @@ class UserLogin(BaseModel):
     )
 
     model_config = ConfigDict(
+        extra="forbid",
         json_schema_extra={
             "example": {
                 "username": "johndoe",
@@ -150,7 +153,7 @@ class UserUpdate(BaseModel):
         description="User's unique username"
     )
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, extra="forbid")
 
 class PasswordUpdate(BaseModel):
     """Schema for password updates"""
@@ -186,6 +189,7 @@ class PasswordUpdate(BaseModel):
         return self
 
     model_config = ConfigDict(
+        extra="forbid",
         json_schema_extra={
             "example": {
                 "current_password": "OldPass123!",
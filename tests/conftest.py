@@ -5,21 +5,30 @@ It sets up the Playwright test environment, including the browser context and pa
 """
 
 
+import itertools
+import os
+import signal
 import socket
 import subprocess
+import tempfile
 import time
 import logging
-from typing import Generator, Dict, List
 from contextlib import contextmanager
+from pathlib import Path
+from types import SimpleNamespace
+from uuid import uuid4
+from typing import Generator, Dict, List
 
 import pytest
 import requests
 from faker import Faker
-from sqlalchemy.orm import Session
-from sqlalchemy.exc import SQLAlchemyError
-from playwright.sync_api import sync_playwright, Browser, Page
+from sqlalchemy import create_engine, text
+from sqlalchemy.engine import Connection, make_url
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import QueuePool, StaticPool
+from playwright.sync_api import sync_playwright, Browser, BrowserContext, Error as PlaywrightError, Page
 
-from app.database import Base, get_engine, get_sessionmaker
+from app.database import Base, get_engine
 from app.models.user import User
 from app.core.config import settings
 from app.database_init import init_db, drop_db
@@ -39,11 +48,75 @@ logger = logging.getLogger(__name__)
 # Database Configuration
 #######################################################
 
+# Set by pytest-xdist ("gw0", "gw1", ...); None when the suite runs serially.
+XDIST_WORKER = os.environ.get("PYTEST_XDIST_WORKER")
+
+# One Faker instance per process; providers are loaded once, here.
 fake = Faker()
-Faker.seed(12345)
+# Offset the seed per xdist worker so workers do not generate identical data.
+fake.seed_instance(12345 + int((XDIST_WORKER or "gw0").lstrip("gw") or 0))
+_user_counter = itertools.count()
 
-test_engine = get_engine(database_url=settings.DATABASE_URL)
-TestingSessionLocal = get_sessionmaker(engine=test_engine)
+def worker_database_url(base_url: str, worker_id: str = None) -> str:
+    """
+    Return the database URL for an xdist worker, creating the database if needed.
+    Each worker gets its own database so drop_all/create_all never race.
+    File-backed SQLite databases get a per-worker file in the temp directory
+    (PYTEST_DEBUG_TEMPROOT if set), so nothing lands next to the original.
+    Serial runs use the base URL unchanged.
+    """
+    if worker_id is None:
+        return base_url
+    url = make_url(base_url)
+    if url.get_backend_name() == "sqlite":
+        # In-memory databases are already private to each worker process.
+        if not url.database or "memory" in url.database:
+            return base_url
+        path = Path(url.database)
+        # The engine is built at import time, before tmp_path_factory exists.
+        worker_dir = Path(os.environ.get("PYTEST_DEBUG_TEMPROOT", tempfile.gettempdir())) / "pytest-sqlite"
+        worker_dir.mkdir(parents=True, exist_ok=True)
+        worker_path = worker_dir / f"{path.stem}_{worker_id}{path.suffix}"
+        return url.set(database=str(worker_path)).render_as_string(hide_password=False)
+    db_name = f"{url.database}_{worker_id}"
+    admin_engine = create_engine(url, isolation_level="AUTOCOMMIT")
+    try:
+        with admin_engine.connect() as conn:
+            exists = conn.execute(
+                text("SELECT 1 FROM pg_database WHERE datname = :name"), {"name": db_name}
+            ).scalar()
+            if not exists:
+                conn.execute(text(f'CREATE DATABASE "{db_name}"'))
+    finally:
+        admin_engine.dispose()
+    return url.set(database=db_name).render_as_string(hide_password=False)
+
+# TEST_DATABASE_URL may point the suite at another database, e.g.
+# "sqlite:///file::memory:?cache=shared&uri=true" for a fast local run without
+# Postgres. Tests marked "postgres", and those needing the live server, are
+# skipped in that mode.
+TEST_DATABASE_URL = worker_database_url(
+    os.environ.get("TEST_DATABASE_URL") or settings.DATABASE_URL, XDIST_WORKER
+)
+USE_SQLITE = TEST_DATABASE_URL.startswith("sqlite")
+
+if USE_SQLITE:
+    # One shared connection, so every session sees the same in-memory database.
+    test_engine = get_engine(
+        database_url=TEST_DATABASE_URL,
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+else:
+    # One pooled engine for the whole session, so fixtures reuse open connections.
+    test_engine = get_engine(
+        database_url=TEST_DATABASE_URL,
+        poolclass=QueuePool,
+        pool_size=10,
+        max_overflow=20,
+        pool_recycle=3600,
+        pool_pre_ping=False,
+    )
 
 #######################################################
 # Helper Functions
@@ -51,46 +124,87 @@ TestingSessionLocal = get_sessionmaker(engine=test_engine)
 def create_fake_user() -> Dict[str, str]:
     """
     Generate a dictionary with fake user data for testing purposes.
+    Email and username get a counter suffix, so they stay unique without
+    Faker's unique proxy remembering every value it has returned.
     """
+    n = next(_user_counter)
     return {
         "first_name": fake.first_name(),
         "last_name": fake.last_name(),
-        "email": fake.unique.email(),
-        "username": fake.unique.user_name(),
+        "email": f"user{n}@example.com",
+        "username": f"user{n}",
         "password": fake.password(length=12)
     }
 
 @contextmanager
-def managed_db_session():
+def discard_sqlite_writes(connection: Connection) -> Generator[None, None, None]:
     """
-    Context manager for handling a database session with rollback on error.
+    On SQLite, delete the rows inserted through `connection` inside the block.
+
+    pysqlite ignores the outer BEGIN the transactional fixtures rely on: the
+    first SAVEPOINT opens the real transaction and releasing it on commit()
+    commits, so the closing rollback undoes nothing. Rows are tracked by rowid,
+    so data that existed before the block (e.g. a module-scoped user) is kept.
+    On PostgreSQL the rollback already discards everything and this is a no-op.
     """
-    session = TestingSessionLocal()
+    if not USE_SQLITE:
+        yield
+        return
+    tables = Base.metadata.sorted_tables
+    marks = {
+        table.name: connection.execute(text(f"SELECT coalesce(max(rowid), 0) FROM {table.name}")).scalar()
+        for table in tables
+    }
+    connection.rollback()  # close the autobegun read so the caller can begin()
     try:
-        yield session
-    except SQLAlchemyError as e:
-        logger.error(f"Database error: {str(e)}")
-        session.rollback()
-        raise
+        yield
+    finally:
+        for table in reversed(tables):
+            connection.execute(text(f"DELETE FROM {table.name} WHERE rowid > :mark"), {"mark": marks[table.name]})
+        connection.commit()
+
+@contextmanager
+def transactional_session(factory: sessionmaker) -> Generator[Session, None, None]:
+    """
+    Yield a session on its own connection whose writes are all discarded on exit.
+
+    The session is bound to a connection with an outer transaction that is rolled
+    back afterwards. Calls to session.commit()/rollback() only release or roll back
+    a SAVEPOINT (join_transaction_mode="create_savepoint"), and SQLAlchemy begins a
+    new one automatically.
+    """
+    connection = test_engine.connect()
+    try:
+        with discard_sqlite_writes(connection):
+            trans = connection.begin()
+            session = factory(bind=connection)
+            try:
+                yield session
+            finally:
+                session.close()
+                trans.rollback()
     finally:
-        session.close()
+        connection.close()
 
 #######################################################
 # Server Startup / Healthcheck
 #######################################################
-def wait_for_server(url: str, timeout: int = 30) -> bool:
+def wait_for_server(url: str, timeout: int = 30, interval: float = 0.05) -> bool:
     """
     Wait for the FastAPI server to respond at the given URL within a timeout.
+    Polls every `interval` seconds over a single reused HTTP session.
     Returns True if the server responds with status 200, else False.
     """
-    start_time = time.time()
-    while (time.time() - start_time) < timeout:
-        try:
-            response = requests.get(url)
-            if response.status_code == 200:
-                return True
-        except requests.exceptions.ConnectionError:
-            time.sleep(1)
+    deadline = time.monotonic() + timeout
+    with requests.Session() as session:
+        while time.monotonic() < deadline:
+            try:
+                response = session.get(url, timeout=0.5)
+                if response.status_code == 200:
+                    return True
+            except requests.exceptions.RequestException:
+                pass
+            time.sleep(interval)
     return False
 
 class ServerStartupError(Exception):
@@ -107,12 +221,17 @@ def setup_test_database(request):
     """
     Pytest fixture to set up and tear down the test database for the session.
     Drops and recreates tables before tests, and optionally drops them after.
+
+    init_db()/drop_db() work on the application's engine, so they only run when
+    the suite targets that same database. A separate TEST_DATABASE_URL (as in
+    docker-compose, under pytest-xdist, or on SQLite) leaves it untouched.
     """
     logger.info("Setting up test database...")
     try:
         Base.metadata.drop_all(bind=test_engine)
         Base.metadata.create_all(bind=test_engine)
-        init_db()
+        if TEST_DATABASE_URL == settings.DATABASE_URL:
+            init_db()
         logger.info("Test database initialized.")
     except Exception as e:
         logger.error(f"Error setting up test database: {str(e)}")
@@ -122,23 +241,36 @@ def setup_test_database(request):
 
     if not request.config.getoption("--preserve-db"):
         logger.info("Dropping test database tables...")
-        drop_db()
+        Base.metadata.drop_all(bind=test_engine)
+        if TEST_DATABASE_URL == settings.DATABASE_URL:
+            drop_db()
+
+@pytest.fixture(scope="session", autouse=True)
+def db_live(setup_test_database):
+    """
+    Check once per session that the test database answers a trivial query,
+    so individual tests do not need their own SELECT 1 probes.
+    """
+    with test_engine.connect() as conn:
+        assert conn.scalar(text("SELECT 1")) == 1
+    logger.info("Database connection check passed.")
+
+@pytest.fixture(scope="session")
+def session_factory() -> sessionmaker:
+    """
+    Session-scoped sessionmaker shared by every test.
+    Sessions it creates join the caller's transaction through SAVEPOINTs.
+    """
+    return sessionmaker(join_transaction_mode="create_savepoint")
 
 @pytest.fixture
-def db_session() -> Generator[Session, None, None]:
+def db_session(session_factory: sessionmaker) -> Generator[Session, None, None]:
     """
     Pytest fixture to provide a database session for a test.
-    Commits on success, rolls back on error, and closes after use.
+    Nothing a test writes outlives it; see transactional_session.
     """
-    session = TestingSessionLocal()
-    try:
+    with transactional_session(session_factory) as session:
         yield session
-        session.commit()
-    except Exception:
-        session.rollback()
-        raise
-    finally:
-        session.close()
 
 #######################################################
 # Test Data Fixtures
@@ -162,17 +294,21 @@ def test_user(db_session: Session) -> User:
     return user
 
 @pytest.fixture
-def seed_users(db_session: Session, request) -> List[User]:
+def seed_users(db_session: Session, request) -> List[SimpleNamespace]:
     """
     Pytest fixture to seed the database with multiple test users.
     Number of users can be set via request.param (default 5).
+
+    Rows go in with a single bulk_insert_mappings call and come back as
+    lightweight SimpleNamespace objects carrying the inserted fields, not ORM
+    instances; query User by id when a test needs the mapped objects.
     """
     num_users = getattr(request, "param", 5)
-    users = [User(**create_fake_user()) for _ in range(num_users)]
-    db_session.add_all(users)
+    rows = [{"id": uuid4(), **create_fake_user()} for _ in range(num_users)]
+    db_session.bulk_insert_mappings(User, rows)
     db_session.commit()
-    logger.info(f"Seeded {len(users)} users.")
-    return users
+    logger.info(f"Seeded {len(rows)} users.")
+    return [SimpleNamespace(**row) for row in rows]
 
 #######################################################
 # FastAPI Server Fixture
@@ -185,50 +321,75 @@ def find_available_port() -> int:
         s.bind(('', 0))
         return s.getsockname()[1]
 
+def stop_server(process: subprocess.Popen, timeout: float = 2) -> None:
+    """
+    Stop a server started by fastapi_server together with any children.
+    Sends SIGTERM to the whole process group, then SIGKILL if it does not exit
+    within `timeout` seconds. On Windows the process is terminated/killed directly.
+    """
+    if os.name == "posix":
+        try:
+            os.killpg(process.pid, signal.SIGTERM)
+        except ProcessLookupError:
+            return
+    else:
+        process.terminate()
+    try:
+        process.wait(timeout=timeout)
+        logger.info("Test server stopped.")
+    except subprocess.TimeoutExpired:
+        if os.name == "posix":
+            os.killpg(process.pid, signal.SIGKILL)
+        else:
+            process.kill()
+        process.wait()
+        logger.warning("Test server forcefully stopped.")
+
 @pytest.fixture(scope="session")
-def fastapi_server():
+def fastapi_server(tmp_path_factory):
     """
     Pytest fixture to start and stop a FastAPI server for tests.
     Finds an available port, starts the server, waits for health, and stops after tests.
+    Each xdist worker starts its own server pointed at the worker's database.
+
+    Uvicorn runs in its own process group so teardown can signal it and any
+    children at once; its output goes to a log file rather than a pipe, so a
+    full pipe buffer can never block the server.
     """
-    base_port = 8000
+    base_port = find_available_port()
     server_url = f'http://127.0.0.1:{base_port}/'
-
-    # Check if port is free; if not, pick an available port
-    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-        if s.connect_ex(('127.0.0.1', base_port)) == 0:
-            base_port = find_available_port()
-            server_url = f'http://127.0.0.1:{base_port}/'
+    log_path = tmp_path_factory.mktemp("server") / "uvicorn.log"
 
     logger.info(f"Starting FastAPI server on port {base_port}...")
 
-    process = subprocess.Popen(
-        ['uvicorn', 'app.main:app', '--host', '127.0.0.1', '--port', str(base_port)],
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
-        text=True,
-        cwd='.'  # ensure the working directory is set correctly
-    )
+    with open(log_path, "w") as log_file:
+        process = subprocess.Popen(
+            [
+                'uvicorn', 'app.main:app', '--host', '127.0.0.1', '--port', str(base_port),
+                # uvloop has no Windows build; fall back to the asyncio loop there.
+                '--loop', 'uvloop' if os.name == "posix" else 'asyncio',
+                '--http', 'httptools', '--no-access-log', '--workers', '1',
+            ],
+            stdout=subprocess.DEVNULL,
+            stderr=log_file,
+            cwd='.',  # ensure the working directory is set correctly
+            env={**os.environ, "DATABASE_URL": TEST_DATABASE_URL},
+            start_new_session=(os.name == "posix"),
+            creationflags=getattr(subprocess, "CREATE_NEW_PROCESS_GROUP", 0),
+        )
 
     # IMPORTANT: Use the /health endpoint for the check!
     health_url = f"{server_url}health"
     if not wait_for_server(health_url, timeout=30):
-        stderr = process.stderr.read()
-        logger.error(f"Server failed to start. Uvicorn error: {stderr}")
-        process.terminate()
+        stop_server(process)
+        logger.error(f"Server failed to start. Uvicorn error: {log_path.read_text()}")
         raise ServerStartupError(f"Failed to start test server on {health_url}")
 
     logger.info(f"Test server running on {server_url}.")
     yield server_url
 
     logger.info("Stopping test server...")
-    process.terminate()
-    try:
-        process.wait(timeout=5)
-        logger.info("Test server stopped.")
-    except subprocess.TimeoutExpired:
-        process.kill()
-        logger.warning("Test server forcefully stopped.")
+    stop_server(process)
 
 #######################################################
 # Playwright Fixtures for UI Testing
@@ -250,23 +411,42 @@ def browser_context():
             logger.info("Closing Playwright browser.")
             browser.close()
 
-@pytest.fixture
-def page(browser_context: Browser):
+@pytest.fixture(scope="session")
+def shared_context(browser_context: Browser) -> Generator[BrowserContext, None, None]:
     """
-    Pytest fixture to create and close a new browser page and context for UI tests.
+    Pytest fixture providing one browser context reused by every UI test.
     """
     context = browser_context.new_context(
         viewport={'width': 1920, 'height': 1080},
         ignore_https_errors=True
     )
-    page = context.new_page()
+    logger.info("Shared browser context created.")
+    try:
+        yield context
+    finally:
+        logger.info("Closing shared browser context.")
+        context.close()
+
+@pytest.fixture
+def page(shared_context: BrowserContext):
+    """
+    Pytest fixture to create and close a new browser page for UI tests.
+    Pages share one context, so localStorage, sessionStorage and cookies are
+    cleared after each test for isolation.
+    """
+    page = shared_context.new_page()
     logger.info("New browser page created.")
     try:
         yield page
     finally:
-        logger.info("Closing browser page and context.")
+        logger.info("Closing browser page.")
+        try:
+            page.evaluate("() => { localStorage.clear(); sessionStorage.clear(); }")
+        except PlaywrightError:
+            # Pages that never left about:blank have no storage to clear.
+            pass
         page.close()
-        context.close()
+        shared_context.clear_cookies()
 
 # #######################################################
 # Pytest Command-Line Options
@@ -283,9 +463,16 @@ def pytest_addoption(parser):
 def pytest_collection_modifyitems(config, items):
     """
     Skip tests marked as 'slow' unless --run-slow is specified.
+    Skip Postgres-only tests, and tests needing the live server, when
+    TEST_DATABASE_URL points at SQLite.
     """
     if not config.getoption("--run-slow"):
         skip_slow = pytest.mark.skip(reason="use --run-slow to run")
         for item in items:
             if "slow" in item.keywords:
-                item.add_marker(skip_slow)
\ No newline at end of file
+                item.add_marker(skip_slow)
+    if USE_SQLITE:
+        skip_pg = pytest.mark.skip(reason="requires PostgreSQL")
+        for item in items:
+            if "postgres" in item.keywords or "fastapi_server" in getattr(item, "fixturenames", ()):
+                item.add_marker(skip_pg)
\ No newline at end of file
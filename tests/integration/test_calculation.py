@@ -1,12 +1,15 @@
 import pytest
 from pydantic import ValidationError
 from uuid import uuid4
-from datetime import datetime
+from datetime import datetime, timezone
 from app.schemas.calculation import (
+    CalculationBase,
     CalculationCreate,
     CalculationUpdate,
-    CalculationResponse
+    CalculationResponse,
+    CalculationType
 )
+from app.models.calculation import Calculation
 
 def test_create_calculation_valid():
     """Test creating a valid CalculationCreate schema."""
@@ -67,6 +70,38 @@ def test_create_calculation_unsupported_type():
     # Check that the error message indicates the value is not permitted.
     assert "one of" in error_message or "not a valid" in error_message
 
+def test_create_calculation_type_is_normalized():
+    """Test CalculationCreate lowercases the calculation type."""
+    data = {
+        "type": "Addition",
+        "inputs": [1, 2],
+        "user_id": uuid4()
+    }
+    calc = CalculationCreate(**data)
+    assert calc.type == "addition"
+
+def test_create_calculation_non_string_type():
+    """Test CalculationCreate fails if 'type' is not a string."""
+    data = {
+        "type": 123,
+        "inputs": [1, 2],
+        "user_id": uuid4()
+    }
+    with pytest.raises(ValidationError) as exc_info:
+        CalculationCreate(**data)
+    assert "one of" in str(exc_info.value).lower()
+
+def test_create_calculation_division_by_zero():
+    """Test CalculationCreate fails if a division divisor is zero."""
+    data = {
+        "type": "division",
+        "inputs": [10, 2, 0],
+        "user_id": uuid4()
+    }
+    with pytest.raises(ValidationError) as exc_info:
+        CalculationCreate(**data)
+    assert "cannot divide by zero" in str(exc_info.value).lower()
+
 def test_update_calculation_valid():
     """Test a valid partial update with CalculationUpdate."""
     data = {
@@ -75,6 +110,17 @@ def test_update_calculation_valid():
     calc_update = CalculationUpdate(**data)
     assert calc_update.inputs == [15.0, 3.0]
 
+def test_update_calculation_rejects_unknown_fields():
+    """Test CalculationUpdate rejects fields it does not define."""
+    with pytest.raises(ValidationError) as exc_info:
+        CalculationUpdate(inputs=[1, 2], result=3)
+    assert "extra inputs are not permitted" in str(exc_info.value).lower()
+
+def test_calculation_base_ignores_client_user_id():
+    """Test CalculationBase drops a client-supplied user_id instead of rejecting it."""
+    calc = CalculationBase(type="addition", inputs=[1, 2], user_id="ignored")
+    assert not hasattr(calc, "user_id")
+
 def test_update_calculation_no_fields():
     """Test that an empty update is allowed (i.e., no fields)."""
     calc_update = CalculationUpdate()
@@ -96,4 +142,19 @@ def test_response_calculation_valid():
     assert calc_response.user_id is not None
     assert calc_response.type == "multiplication"
     assert calc_response.inputs == [6, 7]
-    assert calc_response.result == 42.0
\ No newline at end of file
+    assert calc_response.result == 42.0
+
+def test_response_from_orm_trusted():
+    """Test building a CalculationResponse from a Calculation row without validation."""
+    now = datetime.now(timezone.utc)
+    calc = Calculation.create("Multiplication", uuid4(), [6, 7])
+    calc.id = uuid4()
+    calc.result = calc.get_result()
+    calc.created_at = now
+    calc.updated_at = now
+    calc_response = CalculationResponse.from_orm_trusted(calc)
+    assert calc_response.id == calc.id
+    assert calc_response.type == CalculationType.MULTIPLICATION
+    assert calc_response.inputs == [6, 7]
+    assert calc_response.result == 42.0
+    assert calc_response.model_dump(mode="json")["type"] == "multiplication"
@@ -1,5 +1,6 @@
 import pytest
 import uuid
+from datetime import datetime, timezone
 
 from app.models.calculation import (
     Calculation,
@@ -7,61 +8,81 @@ from app.models.calculation import (
     Subtraction,
     Multiplication,
     Division,
-    AbstractCalculation
+    AbstractCalculation,
+    VECTORIZE_THRESHOLD
 )
 
 
-# Helper function to create a dummy user_id for testing.
-def dummy_user_id():
-    return uuid.uuid4()
+# Fixed dummy user_id for tests that never touch the database.
+DUMMY_UID = uuid.UUID(int=0)
 
-def test_addition_get_result():
+@pytest.mark.parametrize("cls,values,expected", [
+    (Addition, [7, 8, 2.5], 17.5),
+    (Subtraction, [15, 4, 2], 9),
+    (Multiplication, [5, 2, 3], 30),
+    (Division, [60, 3, 4], 5),
+])
+def test_calculation_get_result(cls, values, expected):
     """
-    Test that Addition.get_result returns the correct sum.
+    Test that each calculation subclass returns the correct result.
     """
-    values = [7, 8, 2.5]
-    addition = Addition(user_id=dummy_user_id(), inputs=values)
-    outcome = addition.get_result()
-    assert outcome == sum(values), f"Sum should be {sum(values)}, got {outcome}"
+    calc = cls(user_id=DUMMY_UID, inputs=values)
+    outcome = calc.get_result()
+    assert outcome == expected, f"{cls.__name__} should give {expected}, got {outcome}"
 
-def test_subtraction_get_result():
+@pytest.mark.parametrize("cls,values,expected", [
+    (Addition, [0.5] * VECTORIZE_THRESHOLD, VECTORIZE_THRESHOLD / 2),
+    (Subtraction, [100] + [1] * (VECTORIZE_THRESHOLD - 1), 100 - (VECTORIZE_THRESHOLD - 1)),
+    (Multiplication, [2] * VECTORIZE_THRESHOLD, 2.0 ** VECTORIZE_THRESHOLD),
+    (Division, [2.0 ** VECTORIZE_THRESHOLD] + [2] * (VECTORIZE_THRESHOLD - 1), 2),
+])
+def test_calculation_get_result_long_inputs(cls, values, expected):
     """
-    Test that Subtraction.get_result returns the correct difference.
+    Test that each calculation subclass handles long input lists on the NumPy path.
     """
-    values = [15, 4, 2]
-    subtraction = Subtraction(user_id=dummy_user_id(), inputs=values)
-    # Expected: 15 - 4 - 2 = 9
-    outcome = subtraction.get_result()
-    assert outcome == 9, f"Difference should be 9, got {outcome}"
+    calc = cls(user_id=DUMMY_UID, inputs=values)
+    outcome = calc.get_result()
+    assert isinstance(outcome, float)
+    assert outcome == expected, f"{cls.__name__} should give {expected}, got {outcome}"
 
-def test_multiplication_get_result():
+def test_division_by_zero_long_inputs():
     """
-    Test that Multiplication.get_result returns the correct product.
+    Test that Division.get_result rejects a zero divisor on the NumPy path.
     """
-    values = [5, 2, 3]
-    multiplication = Multiplication(user_id=dummy_user_id(), inputs=values)
-    outcome = multiplication.get_result()
-    assert outcome == 30, f"Product should be 30, got {outcome}"
-
-def test_division_get_result():
-    """
-    Test that Division.get_result returns the correct quotient.
-    """
-    values = [60, 3, 4]
-    division = Division(user_id=dummy_user_id(), inputs=values)
-    # Expected: 60 / 3 / 4 = 5
-    outcome = division.get_result()
-    assert outcome == 5, f"Quotient should be 5, got {outcome}"
+    values = [1] * VECTORIZE_THRESHOLD
+    values[-1] = 0
+    division = Division(user_id=DUMMY_UID, inputs=values)
+    with pytest.raises(ValueError, match="Cannot divide by zero."):
+        division.get_result()
 
 def test_division_by_zero():
     """
     Test that Division.get_result raises ValueError when dividing by zero.
     """
     values = [25, 0, 2]
-    division = Division(user_id=dummy_user_id(), inputs=values)
+    division = Division(user_id=DUMMY_UID, inputs=values)
     with pytest.raises(ValueError, match="Cannot divide by zero."):
         division.get_result()
 
+def test_get_result_is_memoized_per_inputs_list(monkeypatch):
+    """
+    Test that get_result reuses its result until the inputs change.
+    """
+    addition = Addition(user_id=DUMMY_UID, inputs=[1, 2])
+    assert addition.get_result() == 3
+
+    def fail(self):
+        raise AssertionError("result should have come from the cache")
+    monkeypatch.setattr(Addition, "_compute_result", fail)
+    assert addition.get_result() == 3
+
+    monkeypatch.undo()
+    addition.inputs = [4, 5]
+    assert addition.get_result() == 9
+
+    addition.inputs.append(10)
+    assert addition.get_result() == 19
+
 def test_calculation_factory_addition():
     """
     Test the Calculation.create factory method for addition.
@@ -69,7 +90,7 @@ def test_calculation_factory_addition():
     values = [4, 5, 6]
     calc = Calculation.create(
         calculation_type='addition',
-        user_id=dummy_user_id(),
+        user_id=DUMMY_UID,
         inputs=values,
     )
     # Check that the returned instance is an Addition.
@@ -83,7 +104,7 @@ def test_calculation_factory_subtraction():
     values = [12, 7]
     calc = Calculation.create(
         calculation_type='subtraction',
-        user_id=dummy_user_id(),
+        user_id=DUMMY_UID,
         inputs=values,
     )
     # Expected: 12 - 7 = 5
@@ -97,7 +118,7 @@ def test_calculation_factory_multiplication():
     values = [2, 6, 2]
     calc = Calculation.create(
         calculation_type='multiplication',
-        user_id=dummy_user_id(),
+        user_id=DUMMY_UID,
         inputs=values,
     )
     # Expected: 2 * 6 * 2 = 24
@@ -111,7 +132,7 @@ def test_calculation_factory_division():
     values = [48, 2, 4]
     calc = Calculation.create(
         calculation_type='division',
-        user_id=dummy_user_id(),
+        user_id=DUMMY_UID,
         inputs=values,
     )
     # Expected: 48 / 2 / 4 = 6
@@ -125,15 +146,37 @@ def test_calculation_factory_invalid_type():
     with pytest.raises(ValueError, match="Unsupported calculation type"):
         Calculation.create(
             calculation_type='power',  # unsupported type
-            user_id=dummy_user_id(),
+            user_id=DUMMY_UID,
             inputs=[5, 2],
         )
 
+def test_calculation_factory_rejects_base_identity():
+    """
+    Test that the polymorphic base identity is not available through the factory.
+    """
+    with pytest.raises(ValueError, match="Unsupported calculation type"):
+        Calculation.create(
+            calculation_type='calculation',
+            user_id=DUMMY_UID,
+            inputs=[5, 2],
+        )
+
+def test_calculation_registry_contains_subclasses():
+    """
+    Test that every concrete calculation subclass registers its polymorphic identity.
+    """
+    assert AbstractCalculation._REGISTRY == {
+        'addition': Addition,
+        'subtraction': Subtraction,
+        'multiplication': Multiplication,
+        'division': Division,
+    }
+
 def test_invalid_inputs_for_addition():
     """
     Test that providing non-list inputs to Addition.get_result raises a ValueError.
     """
-    addition = Addition(user_id=dummy_user_id(), inputs=42)
+    addition = Addition(user_id=DUMMY_UID, inputs=42)
     with pytest.raises(ValueError, match="Inputs must be a list of numbers."):
         addition.get_result()
 
@@ -141,7 +184,7 @@ def test_invalid_inputs_for_subtraction():
     """
     Test that providing fewer than two numbers to Subtraction.get_result raises a ValueError.
     """
-    subtraction = Subtraction(user_id=dummy_user_id(), inputs=[99])
+    subtraction = Subtraction(user_id=DUMMY_UID, inputs=[99])
     with pytest.raises(ValueError, match="Inputs must be a list with at least two numbers."):
         subtraction.get_result()
 
@@ -149,7 +192,7 @@ def test_invalid_inputs_for_division():
     """
     Test that providing fewer than two numbers to Division.get_result raises a ValueError.
     """
-    division = Division(user_id=dummy_user_id(), inputs=[123])
+    division = Division(user_id=DUMMY_UID, inputs=[123])
     with pytest.raises(ValueError, match="Inputs must be a list with at least two numbers."):
         division.get_result()
 
@@ -169,3 +212,61 @@ def test_abstractcalculation_repr():
     dummy = Dummy()
     assert repr(dummy) == "<Calculation(type=multiplication, inputs=[7, 8, 9])>"
 
+
+def test_abstractcalculation_repr_truncates_long_inputs():
+    class Dummy(AbstractCalculation):
+        type = "addition"
+        inputs = list(range(20))
+    dummy = Dummy()
+    assert repr(dummy) == "<Calculation(type=addition, inputs=[0, 1, 2, 3, 4, 5, 6, 7, ...])>"
+
+
+@pytest.mark.postgres
+def test_calculation_timestamps_set_by_database(db_session, test_user):
+    """
+    Test that created_at/updated_at are filled in by the database and that
+    the update trigger overrides any client-supplied updated_at.
+    """
+    calc = Calculation.create("addition", test_user.id, [1, 2])
+    calc.result = calc.get_result()
+    db_session.add(calc)
+    db_session.commit()
+    assert calc.created_at is not None
+    assert calc.updated_at is not None
+
+    stale = datetime(2000, 1, 1, tzinfo=timezone.utc)
+    calc.updated_at = stale
+    db_session.commit()
+    assert calc.updated_at > stale
+    assert calc.updated_at >= calc.created_at
+
+
+def test_calculation_create_many(db_session, test_user):
+    """
+    Test that Calculation.create_many inserts every row and returns their ids in order.
+    """
+    ids = Calculation.create_many(db_session, [
+        ("addition", test_user.id, [1, 2, 3]),
+        ("Division", test_user.id, [8, 2]),
+    ])
+    db_session.commit()
+    assert len(ids) == 2
+    addition = db_session.get(Calculation, ids[0])
+    division = db_session.get(Calculation, ids[1])
+    assert isinstance(addition, Addition) and addition.result == 6
+    assert isinstance(division, Division) and division.result == 4
+
+
+def test_calculation_create_many_empty(db_session):
+    """
+    Test that Calculation.create_many with no rows issues no INSERT.
+    """
+    assert Calculation.create_many(db_session, []) == []
+
+
+def test_calculation_create_many_invalid_type(db_session, test_user):
+    """
+    Test that Calculation.create_many rejects an unsupported calculation type.
+    """
+    with pytest.raises(ValueError, match="Unsupported calculation type"):
+        Calculation.create_many(db_session, [("power", test_user.id, [2, 3])])
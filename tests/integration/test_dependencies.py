@@ -57,6 +57,15 @@ def test_current_user_valid_token_found(mock_verify_token):
 
     mock_verify_token.assert_called_once_with("validtoken")
 
+# Test get_current_user ignores standard JWT claims carried alongside the user fields
+def test_current_user_payload_with_token_claims(mock_verify_token):
+    mock_verify_token.return_value = {**sample_user_data, "exp": 1700000000, "jti": "abc123", "type": "access"}
+
+    user_response = get_current_user(token="validtoken")
+
+    assert isinstance(user_response, UserResponse)
+    assert user_response.id == sample_user_data["id"]
+
 # Test get_current_user with invalid token (returns None)
 def test_current_user_invalid_token(mock_verify_token):
     mock_verify_token.return_value = None
@@ -118,6 +127,5 @@ def test_current_user_token_returns_uuid(monkeypatch):
     assert user_response.last_name == "User"
     assert user_response.is_active is True
     assert user_response.is_verified is False
-
-
-
+    assert user_response.created_at.tzinfo is not None
+    assert user_response.updated_at == user_response.created_at
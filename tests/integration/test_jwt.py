@@ -1,5 +1,6 @@
 import pytest
 import asyncio
+from unittest.mock import AsyncMock
 from uuid import uuid4
 from jose import jwt
 from fastapi import HTTPException
@@ -93,9 +94,7 @@ class DummyDBInactive:
 @pytest.mark.asyncio
 async def test_get_current_user_success(monkeypatch):
 	# Covers lines 147-167: Success path
-	async def fake_decode_token(token, token_type, verify_exp=True):
-		return {"sub": "user"}
-	monkeypatch.setattr("app.auth.jwt.decode_token", fake_decode_token)
+	monkeypatch.setattr("app.auth.jwt.decode_token", AsyncMock(return_value={"sub": "user"}))
 	user = await get_current_user(token="token", db=DummyDB())
 	assert user.is_active is True
 
@@ -110,9 +109,7 @@ async def test_get_current_user_user_not_found(monkeypatch):
 				def first(self):
 					return None
 			return DummyQuery()
-	async def fake_decode_token(token, token_type, verify_exp=True):
-		return {"sub": "user"}
-	monkeypatch.setattr("app.auth.jwt.decode_token", fake_decode_token)
+	monkeypatch.setattr("app.auth.jwt.decode_token", AsyncMock(return_value={"sub": "user"}))
 	with pytest.raises(HTTPException) as exc_info:
 		await get_current_user(token="token", db=DummyDBNotFound())
 	assert exc_info.value.status_code == 401
@@ -121,9 +118,7 @@ async def test_get_current_user_user_not_found(monkeypatch):
 @pytest.mark.asyncio
 async def test_get_current_user_inactive_user(monkeypatch):
 	# Covers lines 147-167: Inactive user
-	async def fake_decode_token(token, token_type, verify_exp=True):
-		return {"sub": "user"}
-	monkeypatch.setattr("app.auth.jwt.decode_token", fake_decode_token)
+	monkeypatch.setattr("app.auth.jwt.decode_token", AsyncMock(return_value={"sub": "user"}))
 	with pytest.raises(HTTPException) as exc_info:
 		await get_current_user(token="token", db=DummyDBInactive())
 	assert exc_info.value.status_code == 401
@@ -132,9 +127,7 @@ async def test_get_current_user_inactive_user(monkeypatch):
 @pytest.mark.asyncio
 async def test_get_current_user_exception(monkeypatch):
 	# Covers lines 147-167: Exception path
-	async def fake_decode_token(token, token_type, verify_exp=True):
-		raise Exception("unexpected error")
-	monkeypatch.setattr("app.auth.jwt.decode_token", fake_decode_token)
+	monkeypatch.setattr("app.auth.jwt.decode_token", AsyncMock(side_effect=Exception("unexpected error")))
 	with pytest.raises(HTTPException) as exc_info:
 		await get_current_user(token="token", db=DummyDB())
 	assert exc_info.value.status_code == 401
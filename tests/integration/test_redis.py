@@ -1,5 +1,6 @@
 import pytest
 import asyncio
+from unittest.mock import AsyncMock
 from app.auth import redis as redis_mod
 
 class DummyRedis:
@@ -18,9 +19,7 @@ class DummyRedis:
 
 @pytest.mark.asyncio
 async def test_get_redis_returns_client(monkeypatch):
-    async def fake_from_url(url):
-        return DummyRedis()
-    monkeypatch.setattr("redis.asyncio.from_url", fake_from_url)
+    monkeypatch.setattr("redis.asyncio.from_url", AsyncMock(return_value=DummyRedis()))
     # Remove cached redis if present
     if hasattr(redis_mod.get_redis, "redis"):
         delattr(redis_mod.get_redis, "redis")
@@ -30,9 +29,7 @@ async def test_get_redis_returns_client(monkeypatch):
 @pytest.mark.asyncio
 async def test_add_to_blacklist(monkeypatch):
     dummy = DummyRedis()
-    async def fake_get_redis():
-        return dummy
-    monkeypatch.setattr(redis_mod, "get_redis", fake_get_redis)
+    monkeypatch.setattr(redis_mod, "get_redis", AsyncMock(return_value=dummy))
     await redis_mod.add_to_blacklist("jti123", 123)
     assert dummy.set_called
     assert dummy.last_args == ("blacklist:jti123", "1", 123)
@@ -40,9 +37,7 @@ async def test_add_to_blacklist(monkeypatch):
 @pytest.mark.asyncio
 async def test_is_blacklisted(monkeypatch):
     dummy = DummyRedis()
-    async def fake_get_redis():
-        return dummy
-    monkeypatch.setattr(redis_mod, "get_redis", fake_get_redis)
+    monkeypatch.setattr(redis_mod, "get_redis", AsyncMock(return_value=dummy))
     result = await redis_mod.is_blacklisted("revokedjti")
     assert dummy.exists_called
     assert result is True
@@ -28,39 +28,25 @@ def test_user_base_rejects_bad_email():
         UserBase(**data)
 
 
-def test_password_mixin_accepts_strong_password():
-    """PasswordMixin should accept a strong password."""
-    data = {"password": "StrongPass456"}
-    password_mixin = PasswordMixin(**data)
-    assert password_mixin.password == "StrongPass456"
-
-
-
-def test_password_mixin_requires_digit():
-    """PasswordMixin should require at least one digit."""
-    data = {"password": "NoDigitsPresent"}
-    with pytest.raises(ValidationError, match="Password must contain at least one digit"):
-        PasswordMixin(**data)
-
-def test_password_mixin_requires_uppercase():
-    """PasswordMixin should require at least one uppercase character."""
-    data = {"password": "alllowercase2"}
-    with pytest.raises(ValidationError, match="Password must contain at least one uppercase letter"):
-        PasswordMixin(**data)
-
-
-def test_password_mixin_requires_lowercase():
-    """PasswordMixin should require at least one lowercase character."""
-    data = {"password": "ALLUPPERCASE2"}
-    with pytest.raises(ValidationError, match="Password must contain at least one lowercase letter"):
-        PasswordMixin(**data)
-
-def test_password_mixin_rejects_too_short():
-    """PasswordMixin should not allow short passwords."""
-    data = {"password": "tiny"}
-    with pytest.raises(ValidationError):
-        PasswordMixin(**data)
-
+@pytest.mark.parametrize("password,error", [
+    ("StrongPass456", None),
+    ("ŚtrongPass456", None),
+    ("ŚTRONGPASS456", "Password must contain at least one lowercase letter"),
+    ("ℍello1234", None),
+    ("Abcdefg²", None),
+    ("ǅabcdef12", "Password must contain at least one uppercase letter"),
+    ("NoDigitsPresent", "Password must contain at least one digit"),
+    ("alllowercase2", "Password must contain at least one uppercase letter"),
+    ("ALLUPPERCASE2", "Password must contain at least one lowercase letter"),
+    ("tiny", "at least 8 characters"),
+])
+def test_password_mixin_rules(password, error):
+    """PasswordMixin should accept strong passwords and reject each weak form."""
+    if error is None:
+        assert PasswordMixin(password=password).password == password
+    else:
+        with pytest.raises(ValidationError, match=error):
+            PasswordMixin(password=password)
 
 
 def test_user_create_accepts_valid_input():
@@ -109,3 +95,8 @@ def test_user_login_rejects_short_username():
         UserLogin(**data)
 
 
+def test_user_login_rejects_unknown_fields():
+    """UserLogin should not accept fields it does not define."""
+    data = {"username": "alicesmith", "password": "StrongPass456", "remember_me": True}
+    with pytest.raises(ValidationError):
+        UserLogin(**data)
@@ -7,55 +7,83 @@
 
 import pytest
 import logging
-from sqlalchemy import text
+from sqlalchemy import func, insert, select, text
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import sessionmaker
 from datetime import datetime, timezone
 
 from app.models.user import User
-from tests.conftest import create_fake_user, managed_db_session
+from tests.conftest import create_fake_user, test_engine, transactional_session
 
 # Use the logger configured in conftest.py
 logger = logging.getLogger(__name__)
 
+
+def count_users(session) -> int:
+    """Count users with a plain SELECT count(*), without the ORM subquery wrapper."""
+    return session.scalar(select(func.count()).select_from(User))
+
 # ======================================================================================
 # Basic Connection & Session Tests
 # ======================================================================================
 
-def test_database_connection(db_session):
+@pytest.mark.postgres
+def test_db_session_commits_stay_in_test_transaction(db_session):
     """
-    Verify that the database connection is working.
-    
-    Uses the db_session fixture from conftest.py, which truncates tables after each test.
+    Verify that db_session commits only release a SAVEPOINT: other connections
+    never see the row, because the outer transaction is rolled back on teardown.
+    SQLite runs share one connection, so "other" would be the same connection there.
     """
-    result = db_session.execute(text("SELECT 1"))
-    assert result.scalar() == 1
-    logger.info("Database connection test passed")
+    user = User(**create_fake_user())
+    db_session.add(user)
+    db_session.commit()
+    assert db_session.query(User).filter_by(email=user.email).count() == 1
 
+    with test_engine.connect() as other:
+        count = other.execute(
+            text("SELECT COUNT(*) FROM users WHERE email = :email"), {"email": user.email}
+        ).scalar()
+    assert count == 0
 
-def test_managed_session():
+
+def test_committed_rows_do_not_outlive_the_test_transaction(session_factory):
     """
-    Test the managed_db_session context manager for one-off queries and rollbacks.
-    Demonstrates how a manual session context can work alongside the fixture-based approach.
+    Verify that rows committed through a transactional session are gone once it
+    closes, on every backend (SQLite included).
     """
-    with managed_db_session() as session:
-        # Simple query
-        session.execute(text("SELECT 1"))
-        
-        # Generate an error to trigger rollback
-        try:
-            session.execute(text("SELECT * FROM nonexistent_table"))
-        except Exception as e:
-            assert "nonexistent_table" in str(e)
+    data = create_fake_user()
+    with transactional_session(session_factory) as session:
+        session.add(User(**data))
+        session.commit()
+        session.add(User(**create_fake_user()))
+        session.commit()
+
+    with test_engine.connect() as conn:
+        count = conn.execute(
+            text("SELECT COUNT(*) FROM users WHERE email = :email"), {"email": data["email"]}
+        ).scalar()
+    assert count == 0
+
+
+def test_session_query_error(db_session):
+    """
+    Test that a failing query surfaces its error and the session can roll back.
+    """
+    # Generate an error to trigger rollback
+    try:
+        db_session.execute(text("SELECT * FROM nonexistent_table"))
+    except Exception as e:
+        assert "nonexistent_table" in str(e)
+        db_session.rollback()
 
 # ======================================================================================
 # Session Handling & Partial Commits
 # ======================================================================================
 def test_partial_commit_and_rollback(db_session):
     """
-    Test that only valid users are committed when a duplicate triggers rollback.
+    Test that only valid users are kept when a duplicate triggers rollback.
     """
-    initial_count = db_session.query(User).count()
+    initial_count = count_users(db_session)
     logger.info(f"Initial user count before test_partial_commit_and_rollback: {initial_count}")
 
     user1 = User(
@@ -66,7 +94,7 @@ def test_partial_commit_and_rollback(db_session):
         password="hashed_password"
     )
     db_session.add(user1)
-    db_session.commit()
+    db_session.flush()
 
     user2 = User(
         first_name="Beta",
@@ -75,12 +103,11 @@ def test_partial_commit_and_rollback(db_session):
         username="betatwo",
         password="hashed_password"
     )
-    db_session.add(user2)
-    try:
-        db_session.commit()
-    except Exception as e:
-        db_session.rollback()
-        logger.info(f"Expected failure on duplicate user2: {e}")
+    # The SAVEPOINT scopes the expected failure; user1 survives its rollback.
+    with pytest.raises(IntegrityError) as exc_info:
+        with db_session.begin_nested():
+            db_session.add(user2)
+    logger.info(f"Expected failure on duplicate user2: {exc_info.value}")
 
     user3 = User(
         first_name="Gamma",
@@ -90,9 +117,9 @@ def test_partial_commit_and_rollback(db_session):
         password="hashed_password"
     )
     db_session.add(user3)
-    db_session.commit()
+    db_session.flush()
 
-    final_count = db_session.query(User).count()
+    final_count = count_users(db_session)
     expected_final = initial_count + 2
     assert final_count == expected_final, (
         f"Expected {expected_final} users after test, found {final_count}"
@@ -141,12 +168,14 @@ def test_query_user_methods(db_session, seed_users):
     """
     Test user queries: count, filter by email, order by email.
     """
-    user_count = db_session.query(User).count()
+    user_count = count_users(db_session)
     assert user_count >= len(seed_users), "The user table should have at least the seeded users"
     first_user = seed_users[0]
-    found = db_session.query(User).filter_by(email=first_user.email).first()
+    found = db_session.execute(
+        select(User.id).where(User.email == first_user.email).limit(1)
+    ).first()
     assert found is not None, "Should find the seeded user by email"
-    users_by_email = db_session.query(User).order_by(User.email).all()
+    users_by_email = db_session.execute(select(User.id).order_by(User.email)).all()
     assert len(users_by_email) >= len(seed_users), "Query should return at least the seeded users"
 
 # ======================================================================================
@@ -157,7 +186,7 @@ def test_transaction_forces_rollback(db_session):
     """
     Add a user, force error, rollback, and confirm user not committed.
     """
-    initial_count = db_session.query(User).count()
+    initial_count = count_users(db_session)
     try:
         user_data = create_fake_user()
         user = User(**user_data)
@@ -166,7 +195,7 @@ def test_transaction_forces_rollback(db_session):
         db_session.commit()
     except Exception:
         db_session.rollback()
-    final_count = db_session.query(User).count()
+    final_count = count_users(db_session)
     assert final_count == initial_count, "The new user should not have been committed"
 
 # ======================================================================================
@@ -175,14 +204,14 @@ def test_transaction_forces_rollback(db_session):
 
 def test_update_user_email_and_refresh(db_session, test_user):
     """
-    Update user's email, refresh, and check updated fields.
+    Update user's email, commit, and check updated fields.
+    The commit expires the instance, so the asserts below reload it without a refresh.
     """
     original_email = test_user.email
     original_update_time = test_user.updated_at
     new_email = f"updated_{original_email}"
     test_user.email = new_email
     db_session.commit()
-    db_session.refresh(test_user)
     assert test_user.email == new_email, "Email should have been updated"
     assert test_user.updated_at > original_update_time, "Updated time should be newer"
     logger.info(f"Successfully updated user {test_user.id}")
@@ -197,48 +226,29 @@ def test_bulk_insert_users(db_session):
     Bulk insert ten users and verify count (slow test).
     """
     users_data = [create_fake_user() for _ in range(10)]
-    users = [User(**data) for data in users_data]
-    db_session.bulk_save_objects(users)
+    db_session.execute(insert(User), users_data)
     db_session.commit()
-    count = db_session.query(User).count()
+    count = count_users(db_session)
     assert count >= 10, "At least 10 users should now be in the database"
-    logger.info(f"Successfully performed bulk operation with {len(users)} users")
+    logger.info(f"Successfully performed bulk operation with {len(users_data)} users")
 
 # ======================================================================================
 # Uniqueness Constraint Tests
 # ======================================================================================
 
-def test_email_uniqueness_constraint(db_session):
+@pytest.mark.parametrize("dup_field", ["email", "username"])
+def test_uniqueness_constraint(db_session, dup_field):
     """
-    Should raise IntegrityError for duplicate email.
+    Should raise IntegrityError for a duplicate email or username.
     """
     first_user_data = create_fake_user()
-    first_user = User(**first_user_data)
-    db_session.add(first_user)
-    db_session.commit()
+    db_session.add(User(**first_user_data))
+    db_session.flush()
     second_user_data = create_fake_user()
-    second_user_data["email"] = first_user_data["email"]
-    second_user = User(**second_user_data)
-    db_session.add(second_user)
+    second_user_data[dup_field] = first_user_data[dup_field]
+    db_session.add(User(**second_user_data))
     with pytest.raises(IntegrityError):
-        db_session.commit()
-    db_session.rollback()
-
-
-def test_username_uniqueness_constraint(db_session):
-    """
-    Should raise IntegrityError for duplicate username.
-    """
-    first_user_data = create_fake_user()
-    first_user = User(**first_user_data)
-    db_session.add(first_user)
-    db_session.commit()
-    second_user_data = create_fake_user()
-    second_user_data["username"] = first_user_data["username"]
-    second_user = User(**second_user_data)
-    db_session.add(second_user)
-    with pytest.raises(IntegrityError):
-        db_session.commit()
+        db_session.flush()
     db_session.rollback()
 
 # ======================================================================================
@@ -273,7 +283,7 @@ def test_user_still_exists_after_constraint_violation(db_session):
         assert False, "Should have raised IntegrityError"
     except IntegrityError:
         db_session.rollback()
-    found_user = db_session.query(User).filter_by(id=saved_id).first()
+    found_user = db_session.get(User, saved_id)
     assert found_user is not None, "Original user should exist"
     assert found_user.id == saved_id, "Should find original user by ID"
     assert found_user.email == "first@example.com", "Email should be unchanged"
@@ -283,25 +293,28 @@ def test_user_still_exists_after_constraint_violation(db_session):
 # Error Handling Test
 # ======================================================================================
 
-def test_error_handling():
+def test_error_handling(db_session):
     """
-    Verify that a manual managed_db_session can capture and log invalid SQL errors.
+    Verify that invalid SQL raises an error that names the bad statement.
     """
     with pytest.raises(Exception) as exc_info:
-        with managed_db_session() as session:
-            session.execute(text("INVALID SQL"))
+        db_session.execute(text("INVALID SQL"))
     assert "INVALID SQL" in str(exc_info.value)
 
 
 
-def test_user_update_fields(monkeypatch):
-    # Patch utcnow to return a fixed datetime
+@pytest.fixture
+def frozen_time(monkeypatch):
+    """Patch app.models.user.utcnow to return a fixed datetime, and return it."""
     fixed_time = datetime(2025, 8, 11, 15, 0, 0, tzinfo=timezone.utc)
     monkeypatch.setattr("app.models.user.utcnow", lambda: fixed_time)
+    return fixed_time
+
+def test_user_update_fields(frozen_time):
     user = User(first_name="Alice", last_name="Smith", email="alice@example.com", username="alicesmith", password="pw")
     user.updated_at = datetime(2020, 1, 1, tzinfo=timezone.utc)
     updated = user.update(first_name="Bob", is_active=True)
     assert updated is user
     assert user.first_name == "Bob"
     assert user.is_active is True
-    assert user.updated_at == fixed_time
\ No newline at end of file
+    assert user.updated_at == frozen_time
\ No newline at end of file
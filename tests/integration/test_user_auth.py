@@ -1,10 +1,79 @@
 # tests/integration/test_user_auth.py
 
 import pytest
+from types import SimpleNamespace
 from uuid import UUID
 import pydantic_core
 from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
 from app.models.user import User
+from tests.conftest import create_fake_user, discard_sqlite_writes, test_engine
+
+TEST_PASSWORD = "StrongPass456"
+
+
+@pytest.fixture(scope="session")
+def precomputed_hash():
+    """Hash the shared test password once per session; bcrypt is slow by design."""
+    return User.hash_password(TEST_PASSWORD)
+
+
+@pytest.fixture(autouse=True)
+def reuse_password_hash(monkeypatch, precomputed_hash):
+    """
+    Serve the precomputed hash for the shared test password.
+    Other passwords are still hashed for real, and verify_password always runs bcrypt.
+    """
+    original_hash = User.hash_password
+    monkeypatch.setattr(
+        User,
+        "hash_password",
+        staticmethod(lambda pw: precomputed_hash if pw == TEST_PASSWORD else original_hash(pw)),
+    )
+
+
+@pytest.fixture(scope="module")
+def module_connection():
+    """
+    One connection per module with an outer transaction that is rolled back
+    when the module finishes, so the shared registered user never persists.
+    """
+    connection = test_engine.connect()
+    try:
+        with discard_sqlite_writes(connection):
+            trans = connection.begin()
+            try:
+                yield connection
+            finally:
+                trans.rollback()
+    finally:
+        connection.close()
+
+
+@pytest.fixture(scope="module")
+def registered_user(module_connection):
+    """Register one user (one bcrypt hash, one INSERT) shared by the auth tests."""
+    data = {**create_fake_user(), "password": TEST_PASSWORD}
+    with Session(bind=module_connection, join_transaction_mode="create_savepoint") as session:
+        user = User.register(session, data)
+        session.commit()
+        return SimpleNamespace(id=user.id, username=data["username"], email=data["email"])
+
+
+@pytest.fixture
+def auth_session(module_connection, registered_user):
+    """
+    Session on the module connection, wrapped in a SAVEPOINT that is rolled back
+    after each test, so changes such as last_login do not leak between tests.
+    """
+    nested = module_connection.begin_nested()
+    session = Session(bind=module_connection, join_transaction_mode="create_savepoint")
+    try:
+        yield session
+    finally:
+        session.close()
+        nested.rollback()
+
 
 def test_password_hashing_and_check(db_session, fake_user_data):
     """Password hashing should work and verify correctly."""
@@ -56,14 +125,11 @@ def test_registration_fails_for_duplicate_email(db_session):
     with pytest.raises(ValueError, match="Username or email already exists"):
         User.register(db_session, user2_data)
 
-def test_user_authentication_and_token(db_session, fake_user_data):
+def test_user_authentication_and_token(auth_session, registered_user):
     """Authentication should return a valid token."""
-    fake_user_data['password'] = "StrongPass456"
-    user = User.register(db_session, fake_user_data)
-    db_session.commit()
     auth_result = User.authenticate(
-        db_session,
-        fake_user_data['username'],
+        auth_session,
+        registered_user.username,
         "StrongPass456"
     )
     assert auth_result is not None
@@ -72,14 +138,12 @@ def test_user_authentication_and_token(db_session, fake_user_data):
     assert auth_result["token_type"] == "bearer"
     assert "user" in auth_result
 
-def test_last_login_field_is_updated(db_session, fake_user_data):
+def test_last_login_field_is_updated(auth_session, registered_user):
     """last_login should be set after authentication."""
-    fake_user_data['password'] = "StrongPass456"
-    user = User.register(db_session, fake_user_data)
-    db_session.commit()
+    user = auth_session.get(User, registered_user.id)
     assert user.last_login is None
-    auth_result = User.authenticate(db_session, fake_user_data['username'], "StrongPass456")
-    db_session.refresh(user)
+    auth_result = User.authenticate(auth_session, registered_user.username, "StrongPass456")
+    auth_session.refresh(user)
     assert user.last_login is not None
 
 def test_unique_email_and_username_constraint(db_session):
@@ -121,23 +185,25 @@ def test_invalid_token_is_rejected():
     result = User.verify_token(invalid_token)
     assert result is None
 
-def test_token_creation_and_check(db_session, fake_user_data):
+@pytest.mark.parametrize("token", ["not.a.valid.token", "no-dots", "a.b.c"])
+def test_malformed_token_skips_jwt_decode(monkeypatch, token):
+    """Structurally invalid tokens should be rejected before jwt.decode runs."""
+    def fail_decode(*args, **kwargs):
+        raise AssertionError("jwt.decode should not be called")
+    monkeypatch.setattr("jose.jwt.decode", fail_decode)
+    assert User.verify_token(token) is None
+
+def test_token_creation_and_check(registered_user):
     """Should create and verify access token for user."""
-    fake_user_data['password'] = "StrongPass456"
-    user = User.register(db_session, fake_user_data)
-    db_session.commit()
-    token = User.create_access_token({"sub": str(user.id)})
+    token = User.create_access_token({"sub": str(registered_user.id)})
     decoded_user_id = User.verify_token(token)
-    assert decoded_user_id == user.id
+    assert decoded_user_id == registered_user.id
 
-def test_authenticate_with_email_instead_of_username(db_session, fake_user_data):
+def test_authenticate_with_email_instead_of_username(auth_session, registered_user):
     """Should allow authentication using email as identifier."""
-    fake_user_data['password'] = "StrongPass456"
-    user = User.register(db_session, fake_user_data)
-    db_session.commit()
     auth_result = User.authenticate(
-        db_session,
-        fake_user_data['email'],
+        auth_session,
+        registered_user.email,
         "StrongPass456"
     )
     assert auth_result is not None